@@ -3,16 +3,30 @@ import csv
 import json
 import os
 import re
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import ijson
+except ImportError:
+    ijson = None
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QComboBox, QTableView, QHeaderView, QPushButton,
     QDialog, QDateTimeEdit, QLabel, QMessageBox,
-    QFileDialog
+    QFileDialog, QStyledItemDelegate, QStyle, QStyleOptionButton
 )
 from PyQt6.QtCore import (
     Qt, QAbstractTableModel, QModelIndex, QDateTime,
-    QSortFilterProxyModel
+    QTimer, QRunnable, QThreadPool
 )
 from PyQt6.QtGui import QFont, QColor
 
@@ -41,13 +55,167 @@ PROVINCE_MAP = {
     "CN-YN": "云南", "CN-ZJ": "浙江"
 }
 
+_PROVINCE_ITEMS_SORTED = tuple(sorted(PROVINCE_MAP.items(), key=lambda x: x[1]))
+# 省份代码须为独立的一项，前后不能紧挨字母、数字或连字符
+_PROVINCE_RE = re.compile(r'(?<![\w-])(?:' + '|'.join(map(re.escape, sorted(PROVINCE_MAP))) + r')(?![\w-])')
+if ahocorasick is not None:
+    _PROVINCE_AUTOMATON = ahocorasick.Automaton()
+    for _code in PROVINCE_MAP:
+        _PROVINCE_AUTOMATON.add_word(_code, _code)
+    _PROVINCE_AUTOMATON.make_automaton()
+CSV_COLUMNS = ['reference', 'name', 'locationDesc']
+
 PARKS_DATA_FILE = "parks_data.json"
 CONFIG_FILE = "config.json"
+SAVE_DELAY_MS = 500
+LOAD_BATCH_SIZE = 500
+ACTIVATION_COLUMN = 2
+ActivatedRole = Qt.ItemDataRole.UserRole + 1
+_ACTIVATED_BG = QColor(0xD1, 0xFA, 0xE5)
 
 
 def get_park_number_int(reference):
-    match = re.search(r'-(\\d+)', reference)
-    return int(match.group(1)) if match else 0
+    tail = reference.rpartition('-')[2]
+    return int(tail) if tail.isdecimal() else 0
+
+
+def _json_default(obj):
+    # 省份集合以有序列表形式写入 JSON
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dump_json_bytes(obj):
+    """优先使用 orjson 序列化，未安装时退回标准库"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=_json_default)
+    return json.dumps(obj, ensure_ascii=False, indent=2, default=_json_default).encode('utf-8')
+
+
+def load_json_file(path):
+    raw = Path(path).read_bytes()
+    if orjson is not None:
+        # orjson 不接受 BOM，与标准库的 utf-8-sig 行为保持一致
+        if raw.startswith(b'\xef\xbb\xbf'):
+            raw = raw[3:]
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8-sig'))
+
+
+def _skip_bom(f):
+    if f.read(3) != b'\xef\xbb\xbf':
+        f.seek(0)
+
+
+def is_json_array_file(path):
+    """判断 JSON 文件顶层是否为数组（跳过 BOM 和空白）"""
+    with open(path, 'rb') as f:
+        _skip_bom(f)
+        head = f.read(1)
+        while head.isspace():
+            head = f.read(1)
+    return head == b'['
+
+
+def _is_code_boundary(desc, pos):
+    return pos < 0 or pos >= len(desc) or not (desc[pos].isalnum() or desc[pos] in '_-')
+
+
+def parse_provinces(desc):
+    """一次扫描 locationDesc，取出其中的中国省份代码"""
+    if ahocorasick is not None:
+        return frozenset(
+            code for end, code in _PROVINCE_AUTOMATON.iter(desc)
+            if _is_code_boundary(desc, end - len(code)) and _is_code_boundary(desc, end + 1)
+        )
+    return frozenset(map(sys.intern, _PROVINCE_RE.findall(desc)))
+
+
+def read_csv_rows(filename):
+    """读取 POTA CSV，返回 (编号, 名称, 省份集合) 列表，跳过字段不全的行"""
+    # pandas 只在导入 CSV 时才需要，不在启动时加载
+    try:
+        import pandas as pd
+    except ImportError:
+        pd = None
+    if pd is not None:
+        try:
+            df = pd.read_csv(filename, usecols=lambda c: c in CSV_COLUMNS, dtype=str,
+                             na_filter=False, encoding='utf-8-sig')
+        except pd.errors.EmptyDataError:
+            return []
+        except pd.errors.ParserError:
+            # 字段数不一致的行交给 csv 模块处理，与未安装 pandas 时行为一致
+            df = None
+        if df is not None:
+            df = df.reindex(columns=CSV_COLUMNS, fill_value='')
+            df = df[(df.reference != '') & (df.name != '') & (df.locationDesc != '')]
+            provinces = df.locationDesc.map(parse_provinces)
+            return list(zip(map(sys.intern, df.reference), df.name, provinces))
+
+    rows = []
+    with open(filename, 'r', encoding='utf-8-sig') as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            ref, name, desc = row.get('reference'), row.get('name'), row.get('locationDesc')
+            if not ref or not name or not desc:
+                continue
+            rows.append((sys.intern(ref), name, parse_provinces(desc)))
+    return rows
+
+
+def write_parks_file(rows):
+    """先写临时文件再替换，避免中途退出损坏数据文件"""
+    tmp_path = PARKS_DATA_FILE + ".tmp"
+    Path(tmp_path).write_bytes(dump_json_bytes(rows))
+    os.replace(tmp_path, PARKS_DATA_FILE)
+
+
+# =========================
+# 公园记录
+# =========================
+@dataclass(slots=True)
+class Park:
+    reference: str
+    name: str
+    provinces: frozenset
+    activated: bool = False
+    activation_time: Optional[str] = None
+    num: int = 0
+
+    @classmethod
+    def from_dict(cls, row):
+        return cls(
+            reference=sys.intern(row['reference']),
+            name=row['name'],
+            provinces=frozenset(row.get('provinces', ())),
+            activated=row.get('activated', False),
+            activation_time=row.get('activation_time'),
+            num=get_park_number_int(row['reference'])
+        )
+
+    def to_dict(self):
+        # 只写入持久化字段，num 由编号推导，加载时重新计算
+        return {
+            'reference': self.reference,
+            'name': self.name,
+            'provinces': self.provinces,
+            'activated': self.activated,
+            'activation_time': self.activation_time
+        }
+
+
+# =========================
+# 后台保存任务
+# =========================
+class SaveParksTask(QRunnable):
+    def __init__(self, rows):
+        super().__init__()
+        self.rows = rows
+
+    def run(self):
+        write_parks_file(self.rows)
 
 
 # =========================
@@ -64,7 +232,6 @@ class ActivationDialog(QDialog):
 
     def setup_ui(self):
         layout = QVBoxLayout(self)
-        self.setStyleSheet(QSS)
         layout.addWidget(QLabel(f"<b>记录激活:</b> {self.park_name} ({self.park_ref})"))
         layout.addWidget(QLabel("选择激活日期:"))
 
@@ -93,10 +260,15 @@ class ActivationDialog(QDialog):
 # 数据模型
 # =========================
 class ParkTableModel(QAbstractTableModel):
+    _HANDLED_ROLES = (
+        Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.BackgroundRole, ActivatedRole
+    )
+
     def __init__(self, data, parent=None):
         super().__init__(parent)
         self._data = data
-        self.header_labels = ["序号", "公园编号", "公园名称", "激活日期 / 操作"]
+        self._rows = {p.reference: i for i, p in enumerate(data)}
+        self.header_labels = ["公园编号", "公园名称", "激活日期 / 操作"]
 
     def rowCount(self, parent=QModelIndex()):
         return len(self._data)
@@ -105,55 +277,83 @@ class ParkTableModel(QAbstractTableModel):
         return len(self.header_labels)
 
     def data(self, index, role=Qt.ItemDataRole.DisplayRole):
-        if not index.isValid():
+        # 视图会查询很多未实现的角色，先行排除
+        if role not in self._HANDLED_ROLES or not index.isValid():
             return None
         row, col = index.row(), index.column()
         park = self._data[row]
 
         if role == Qt.ItemDataRole.DisplayRole:
             if col == 0:
-                return str(row + 1)
+                return park.reference
             elif col == 1:
-                return park['reference']
+                return park.name
             elif col == 2:
-                return park['name']
-            elif col == 3:
-                return park['activation_time'] if park['activated'] else "激活"
+                return park.activation_time if park.activated else "激活"
+
+        elif role == Qt.ItemDataRole.BackgroundRole:
+            if park.activated:
+                return _ACTIVATED_BG
 
-        elif role == Qt.ItemDataRole.UserRole:
-            return get_park_number_int(park['reference'])
+        elif role == ActivatedRole:
+            return park.activated
 
         return None
 
-    def headerData(self, section, orientation, role):
-        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
-            return self.header_labels[section]
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole:
+            if orientation == Qt.Orientation.Horizontal:
+                return self.header_labels[section]
+            # 行表头显示序号
+            return str(section + 1)
         return None
 
-    def update_data(self, new_data):
-        self.beginResetModel()
-        self._data = new_data
-        self.endResetModel()
+    def set_rows(self, new_rows):
+        """替换显示的数据，只对尾部增删行发出结构信号，避免重置整个模型"""
+        old_count, new_count = len(self._data), len(new_rows)
+        if new_count < old_count:
+            self.beginRemoveRows(QModelIndex(), new_count, old_count - 1)
+            self._data = new_rows
+            self.endRemoveRows()
+        elif new_count > old_count:
+            self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
+            self._data = new_rows
+            self.endInsertRows()
+        else:
+            self._data = new_rows
+        self._rows = {p.reference: i for i, p in enumerate(new_rows)}
+        overlap = min(old_count, new_count)
+        if overlap:
+            self.dataChanged.emit(self.index(0, 0), self.index(overlap - 1, self.columnCount() - 1))
+
+    def row_of(self, park_ref):
+        return self._rows.get(park_ref, -1)
+
+    def mark_activated(self, row, activation_time):
+        """标记单行为已激活，只通知该行变化"""
+        park = self._data[row]
+        park.activated = True
+        park.activation_time = activation_time
+        self.dataChanged.emit(
+            self.index(row, 0), self.index(row, self.columnCount() - 1),
+            [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.BackgroundRole, ActivatedRole]
+        )
 
 
 # =========================
-# 代理模型：行高亮
+# 激活列：绘制按钮，不创建控件
 # =========================
-class ParkSortingProxyModel(QSortFilterProxyModel):
-    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
-        if not index.isValid():
-            return None
-        source_index = self.mapToSource(index)
-        source_model = self.sourceModel()
-        if index.column() == 0 and role == Qt.ItemDataRole.DisplayRole:
-            return str(index.row() + 1)
-        if role == Qt.ItemDataRole.BackgroundRole:
-            if source_index.row() >= len(source_model._data):
-                return None
-            park = source_model._data[source_index.row()]
-            if park.get('activated', False):
-                return QColor("#D1FAE5")
-        return super().data(index, role)
+class ActivationButtonDelegate(QStyledItemDelegate):
+    def paint(self, painter, option, index):
+        if index.data(ActivatedRole):
+            super().paint(painter, option, index)
+            return
+        opt = QStyleOptionButton()
+        opt.rect = option.rect.adjusted(4, 2, -4, -2)
+        opt.text = index.data(Qt.ItemDataRole.DisplayRole)
+        opt.state = QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Raised
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_PushButton, opt, painter, option.widget)
 
 
 # =========================
@@ -164,39 +364,114 @@ class PotaLogbookApp(QMainWindow):
         super().__init__()
         self.setWindowTitle("POTA 公园激活记录")
         self.setGeometry(100, 100, 1000, 600)
-        self.setStyleSheet(QSS)
         self.all_parks = []
+        self._by_ref = {}
+        self._by_province = {}
         self.config = self.load_config()
-        self.load_parks_from_json()
+        self._config_dirty = False
+        self._config_timer = QTimer(self)
+        self._config_timer.setSingleShot(True)
+        self._config_timer.setInterval(SAVE_DELAY_MS)
+        self._config_timer.timeout.connect(self.flush_config)
+        self._parks_dirty = False
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self.flush_parks)
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
         self.setup_ui()
         self.restore_last_province()
-        self.filter_parks()
+        # 恢复省份后再连接信号，避免构建界面时重复筛选
+        self.province_combo.currentIndexChanged.connect(self.filter_parks)
+        # 窗口显示后再加载公园数据
+        QTimer.singleShot(0, self.load_initial_parks)
 
     # ---- 配置加载与保存 ----
     def load_config(self):
         if os.path.exists(CONFIG_FILE):
             try:
-                with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return load_json_file(CONFIG_FILE)
             except Exception:
                 return {}
         return {}
 
     def save_config(self):
-        with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(self.config, f, ensure_ascii=False, indent=4)
+        Path(CONFIG_FILE).write_bytes(dump_json_bytes(self.config))
+
+    def schedule_save_config(self):
+        """延迟保存配置，合并短时间内的多次修改"""
+        self._config_dirty = True
+        self._config_timer.start()
+
+    def flush_config(self):
+        self._config_timer.stop()
+        if self._config_dirty:
+            self._config_dirty = False
+            self.save_config()
+
+    def closeEvent(self, event):
+        self.flush_config()
+        self._save_timer.stop()
+        self._save_pool.waitForDone()
+        if self._parks_dirty:
+            self.save_parks_to_json()
+        super().closeEvent(event)
 
     # ---- 数据加载与保存 ----
+    def load_initial_parks(self):
+        """启动时加载公园数据，加载期间禁用界面"""
+        self.centralWidget().setEnabled(False)
+        try:
+            self.load_parks_from_json()
+        finally:
+            self.centralWidget().setEnabled(True)
+        self.filter_parks()
+
     def load_parks_from_json(self):
         if os.path.exists(PARKS_DATA_FILE):
-            with open(PARKS_DATA_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if orjson is None and ijson is not None and is_json_array_file(PARKS_DATA_FILE):
+                # 没有 orjson 时流式读取，每批处理完让出事件循环；
+                # 顶层不是数组时走下面的整体读取，与其报错和忽略行为一致
+                parks = []
+                with open(PARKS_DATA_FILE, 'rb') as f:
+                    _skip_bom(f)
+                    for i, row in enumerate(ijson.items(f, 'item'), 1):
+                        parks.append(Park.from_dict(row))
+                        if i % LOAD_BATCH_SIZE == 0:
+                            QApplication.processEvents()
+                self.all_parks = parks
+            else:
+                data = load_json_file(PARKS_DATA_FILE)
                 if isinstance(data, list):
-                    self.all_parks = data
+                    self.all_parks = [Park.from_dict(row) for row in data]
+        self.rebuild_indexes()
+
+    def rebuild_indexes(self):
+        """按编号排序公园列表，并重建编号和省份索引"""
+        self.all_parks.sort(key=lambda p: p.num)
+        self._by_ref = {p.reference: p for p in self.all_parks}
+        # 按已排序的列表构建，各省份列表同样有序
+        self._by_province = {}
+        for p in self.all_parks:
+            for c in p.provinces:
+                self._by_province.setdefault(c, []).append(p)
 
     def save_parks_to_json(self):
-        with open(PARKS_DATA_FILE, 'w', encoding='utf-8') as f:
-            json.dump(self.all_parks, f, ensure_ascii=False, indent=4)
+        self._parks_dirty = False
+        write_parks_file([p.to_dict() for p in self.all_parks])
+
+    def schedule_save_parks(self):
+        """延迟到后台线程保存公园数据，合并连续的修改"""
+        self._parks_dirty = True
+        self._save_timer.start()
+
+    def flush_parks(self):
+        if not self._parks_dirty:
+            return
+        self._parks_dirty = False
+        # 在界面线程中取快照，后台线程只负责序列化和写盘
+        self._save_pool.start(SaveParksTask([p.to_dict() for p in self.all_parks]))
 
     # ---- UI 初始化 ----
     def setup_ui(self):
@@ -208,10 +483,11 @@ class PotaLogbookApp(QMainWindow):
         hl = QHBoxLayout()
         hl.addWidget(QLabel("<b>选择省份:</b>"))
         self.province_combo = QComboBox()
-        self.province_combo.addItem("全部省份", userData=None)
-        for code, name in sorted(PROVINCE_MAP.items(), key=lambda x: x[1]):
-            self.province_combo.addItem(f"{name} ({code})", userData=code)
-        self.province_combo.currentIndexChanged.connect(self.filter_parks)
+        self.province_combo.blockSignals(True)
+        self.province_combo.addItems(["全部省份"] + [f"{name} ({code})" for code, name in _PROVINCE_ITEMS_SORTED])
+        for i, (code, _) in enumerate(_PROVINCE_ITEMS_SORTED, 1):
+            self.province_combo.setItemData(i, code)
+        self.province_combo.blockSignals(False)
         hl.addWidget(self.province_combo)
 
         import_btn = QPushButton("导入 CSV 文件")
@@ -220,16 +496,19 @@ class PotaLogbookApp(QMainWindow):
         hl.addStretch(1)
         layout.addLayout(hl)
 
+        # 公园列表在加载时已按编号排序，表格直接使用数据模型，无需代理排序
         self.park_table_model = ParkTableModel([], self)
-        self.proxy_model = ParkSortingProxyModel(self)
-        self.proxy_model.setSourceModel(self.park_table_model)
-        self.proxy_model.setSortRole(Qt.ItemDataRole.UserRole)
 
         self.park_table_view = QTableView()
-        self.park_table_view.setModel(self.proxy_model)
-        self.park_table_view.setSortingEnabled(True)
+        self.park_table_view.setModel(self.park_table_model)
         self.park_table_view.setAlternatingRowColors(True)
         self.park_table_view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.park_table_view.verticalHeader().setVisible(True)
+        self.park_table_view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.park_table_view.setItemDelegateForColumn(ACTIVATION_COLUMN, ActivationButtonDelegate(self.park_table_view))
+        self.park_table_view.clicked.connect(self.on_table_clicked)
+        # 回车键同样可以激活，保证键盘可用
+        self.park_table_view.activated.connect(self.on_table_clicked)
         layout.addWidget(self.park_table_view)
 
     def restore_last_province(self):
@@ -243,11 +522,11 @@ class PotaLogbookApp(QMainWindow):
     # ---- 数据筛选与刷新 ----
     def filter_parks(self):
         code = self.province_combo.currentData()
-        self.config["last_province_code"] = code
-        self.save_config()
-        parks = self.all_parks if code is None else [p for p in self.all_parks if code in p['provinces']]
-        self.park_table_model.update_data(parks)
-        self.update_activation_buttons()
+        if self.config.get("last_province_code") != code:
+            self.config["last_province_code"] = code
+            self.schedule_save_config()
+        parks = self.all_parks if code is None else self._by_province.get(code, [])
+        self.park_table_model.set_rows(parks)
 
     # ---- CSV 导入 ----
     def import_csv_action(self):
@@ -255,7 +534,7 @@ class PotaLogbookApp(QMainWindow):
         if filename:
             # 调用导入逻辑并获取处理的公园数量
             park_count = self.load_parks_from_csv(filename)
-            self.save_parks_to_json()
+            self.schedule_save_parks()
             self.filter_parks()
             
             # 导入完成后显示成功提示
@@ -266,57 +545,52 @@ class PotaLogbookApp(QMainWindow):
             )
 
     def load_parks_from_csv(self, filename):
-        existing = {p['reference']: p for p in self.all_parks}
+        existing = self._by_ref
         new_list = []
-        processed_count = 0 # 记录处理的公园数量
-        with open(filename, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                ref, name, desc = row.get('reference'), row.get('name'), row.get('locationDesc')
-                if not ref or not name or not desc:
-                    continue
-                provinces = [c.strip() for c in desc.split(',') if c.strip() in PROVINCE_MAP]
-                exist = existing.get(ref, {})
-                new_list.append({
-                    'reference': ref,
-                    'name': name,
-                    'provinces': provinces,
-                    'activated': exist.get('activated', False),
-                    'activation_time': exist.get('activation_time', None)
-                })
-                processed_count += 1 # 增加计数
+        for ref, name, provinces in read_csv_rows(filename):
+            exist = existing.get(ref)
+            new_list.append(Park(
+                reference=ref,
+                name=name,
+                provinces=provinces,
+                activated=exist.activated if exist else False,
+                activation_time=exist.activation_time if exist else None,
+                num=get_park_number_int(ref)
+            ))
+        processed_count = len(new_list) # 记录处理的公园数量
         self.all_parks = new_list
+        self.rebuild_indexes()
         return processed_count # 返回处理的公园数量
 
     # ---- 激活功能 ----
-    def update_activation_buttons(self):
-        for row in range(self.proxy_model.rowCount()):
-            idx = self.proxy_model.index(row, 3)
-            park = self.proxy_model.sourceModel()._data[self.proxy_model.mapToSource(idx).row()]
-            if not park.get('activated', False):
-                btn = QPushButton("激活")
-                btn.clicked.connect(lambda checked=False, ref=park['reference']: self.prompt_activation(ref))
-                self.park_table_view.setIndexWidget(idx, btn)
-            else:
-                self.park_table_view.setIndexWidget(idx, None)
+    def on_table_clicked(self, index):
+        if index.column() != ACTIVATION_COLUMN or index.data(ActivatedRole):
+            return
+        park = self.park_table_model._data[index.row()]
+        self.prompt_activation(park.reference)
 
     def prompt_activation(self, park_ref):
-        park = next((p for p in self.all_parks if p['reference'] == park_ref), None)
+        park = self._by_ref.get(park_ref)
         if not park:
             QMessageBox.warning(self, "错误", f"未找到公园 {park_ref}")
             return
-        dlg = ActivationDialog(park_ref, park['name'], self)
+        dlg = ActivationDialog(park_ref, park.name, self)
         if dlg.exec():
-            park['activated'] = True
-            park['activation_time'] = dlg.activation_time
-            self.save_parks_to_json()
-            self.filter_parks()
+            row = self.park_table_model.row_of(park_ref)
+            if row >= 0:
+                self.park_table_model.mark_activated(row, dlg.activation_time)
+            else:
+                park.activated = True
+                park.activation_time = dlg.activation_time
+            self.schedule_save_parks()
             QMessageBox.information(self, "成功", f"公园 {park_ref} 已激活：{dlg.activation_time}")
 
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
+    # 样式表设置在应用上，所有窗口和对话框共用一次解析结果
+    app.setStyleSheet(QSS)
     app.setFont(QFont("Inter", 10))
     w = PotaLogbookApp()
     w.show()